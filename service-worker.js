@@ -1,4 +1,4 @@
-const CACHE_NAME = 'funnel-tracker-cache-v1';
+const CACHE_NAME = 'funnel-tracker-cache-v2';
 const OFFLINE_ASSETS = [
   './',
   './index.html',